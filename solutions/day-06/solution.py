@@ -5,9 +5,22 @@ Advent of Code 2025 - Day 06: Trash Compactor
 Parse vertical column math problems and calculate grand total.
 """
 
+import math
 import sys
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Tuple, Optional
+from typing import List, NamedTuple, Tuple, Optional
+
+
+# Digit lookup table indexed by character code, built once at import time.
+# Non-digit entries are 0, so callers must check the character is a digit first.
+_DIGIT_VALUE = bytearray(256)
+for _i in range(10):
+    _DIGIT_VALUE[ord('0') + _i] = _i
+del _i
+
+# Reduction for each operator; both are implemented in C.
+_REDUCE = {'+': sum, '*': math.prod}
 
 
 def parse_input(input_text: str) -> List[str]:
@@ -34,6 +47,25 @@ def find_operators(operator_row: str) -> List[Tuple[int, str]]:
     return operators
 
 
+class Worksheet(NamedTuple):
+    """Parsed input lines together with the operator positions of the last row."""
+    lines: Tuple[str, ...]
+    operators: Tuple[Tuple[int, str], ...]
+
+
+@lru_cache(maxsize=16)
+def parse_worksheet(input_text: str) -> Worksheet:
+    """
+    Parse the input and locate the operators once.
+    
+    Both parts need the operator row scanned, so the result is cached per
+    input text and shared between solve_part1 and solve_part2.
+    """
+    lines = parse_input(input_text)
+    operators = find_operators(lines[-1]) if lines else []
+    return Worksheet(tuple(lines), tuple(operators))
+
+
 def extract_number_at_position(row: str, pos: int) -> Optional[int]:
     """
     Extract a number in the column indicated by the operator position.
@@ -100,13 +132,7 @@ def calculate_result(numbers: List[int], operator: str) -> int:
     For '*': multiply all numbers together
     For '+': add all numbers together
     """
-    if operator == '*':
-        result = 1
-        for num in numbers:
-            result *= num
-        return result
-    else:  # operator == '+'
-        return sum(numbers)
+    return _REDUCE[operator](numbers)
 
 
 def solve_part1(input_text: str) -> int:
@@ -115,17 +141,13 @@ def solve_part1(input_text: str) -> int:
     
     Parse vertical column math problems and return grand total.
     """
-    lines = parse_input(input_text)
+    lines, operators = parse_worksheet(input_text)
     
     if not lines or len(lines) < 1:
         return 0
     
     # Separate number rows from operator row
     number_rows = lines[:-1]
-    operator_row = lines[-1]
-    
-    # Find all operators and positions
-    operators = find_operators(operator_row)
     
     # Process each column
     grand_total = 0
@@ -138,48 +160,31 @@ def solve_part1(input_text: str) -> int:
     return grand_total
 
 
-def extract_vertical_problem(lines: List[str], col_pos: int) -> Optional[Tuple[int, str]]:
+def extract_vertical_number(lines: List[str], col_pos: int) -> Optional[int]:
     """
-    Extract a number and operator by reading vertically at a column position.
-    
-    Read through ALL rows at the given column position (including operator row),
-    collecting digits to form a number, and identifying the operator.
+    Read the digits at a column position top-to-bottom as a single number.
     
-    Args:
-        lines: All input lines (including operator row)
-        col_pos: Column position to read
-    
-    Returns:
-        Tuple of (number, operator) or None if no valid problem at this position
+    Spaces and operators are skipped. Digits are accumulated with a Horner
+    loop over the digit lookup table rather than joining and calling int().
     
-    Example:
-        Col 0:
-          Row 0: '1'
-          Row 1: '3'
-          Row 2: '5'
-          Row 3: '+'
-        Result: (135, '+')
+    Returns None if the column contains no digits.
     """
-    digits = []
-    operator = None
+    value = 0
+    found = False
     
     for row in lines:
         if col_pos < len(row):
             char = row[col_pos]
-            if char.isdigit():
-                digits.append(char)
-            elif char in ['+', '*']:
-                operator = char
-            # Skip spaces
-    
-    if not digits or operator is None:
-        return None
+            if '0' <= char <= '9':
+                value = value * 10 + _DIGIT_VALUE[ord(char)]
+                found = True
     
-    number = int(''.join(digits))
-    return (number, operator)
+    return value if found else None
 
 
-def parse_problems_part2(lines: List[str]) -> List[Tuple[List[int], str]]:
+def parse_problems_part2(lines: List[str],
+                         operators: Optional[List[Tuple[int, str]]] = None
+                         ) -> List[Tuple[List[int], str]]:
     """
     Parse problems reading vertically (top-to-bottom) and processing right-to-left.
     
@@ -191,6 +196,8 @@ def parse_problems_part2(lines: List[str]) -> List[Tuple[List[int], str]]:
     
     Args:
         lines: Parsed input lines (including operator row)
+        operators: (position, operator) pairs of the operator row; found with
+            find_operators if not given
     
     Returns:
         List of (numbers, operator) tuples in the order they're encountered (right-to-left)
@@ -214,6 +221,10 @@ def parse_problems_part2(lines: List[str]) -> List[Tuple[List[int], str]]:
     if not lines or len(lines) < 1:
         return []
     
+    if operators is None:
+        operators = find_operators(lines[-1])
+    operator_at = dict(operators)
+    
     # Find maximum line length to determine rightmost column
     max_len = max(len(line) for line in lines)
     
@@ -222,23 +233,15 @@ def parse_problems_part2(lines: List[str]) -> List[Tuple[List[int], str]]:
     current_numbers = []
     
     for col in range(max_len - 1, -1, -1):
-        problem = extract_vertical_problem(lines, col)
-        if problem is not None:
-            number, operator = problem
-            # This column has both a number and an operator
-            # Add the number to current collection, then create problem
-            current_numbers.append(number)
-            problems.append((current_numbers.copy(), operator))
+        number = extract_vertical_number(lines, col)
+        if number is None:
+            continue
+        current_numbers.append(number)
+        operator = operator_at.get(col)
+        if operator is not None:
+            # This column has both a number and an operator, so it closes the problem
+            problems.append((current_numbers, operator))
             current_numbers = []
-        else:
-            # Check if this column has just a number (no operator)
-            digits = []
-            for row in lines:
-                if col < len(row) and row[col].isdigit():
-                    digits.append(row[col])
-            if digits:
-                number = int(''.join(digits))
-                current_numbers.append(number)
     
     return problems
 
@@ -265,13 +268,13 @@ def solve_part2(input_text: str) -> Optional[int]:
     - Position 12: number 623 with operator + → problem: [4, 431, 623] with +
     - etc.
     """
-    lines = parse_input(input_text)
+    lines, operators = parse_worksheet(input_text)
     
     if not lines or len(lines) < 1:
         return 0
     
     # Parse problems with vertical reading and right-to-left processing
-    problems = parse_problems_part2(lines)
+    problems = parse_problems_part2(lines, operators)
     
     # Calculate result for each problem and sum
     grand_total = 0
@@ -453,221 +453,67 @@ class TestDay06Part2MainExample(unittest.TestCase):
         self.assertEqual(result, 3263827, "Main example Part 2 should return 3,263,827")
 
 
-class TestDay06Part2VerticalReading(unittest.TestCase):
-    """Tests for Part 2 vertical reading logic - reading each position top-to-bottom."""
+class Part2SmokeCases:
+    """Mixin running solve_part2 on each input in the class's CASES.
     
-    def test_vertical_reading_explanation(self):
-        """Document the vertical reading interpretation.
-        
-        Based on task description:
-        "Each character position is a column, and reading TOP to BOTTOM 
-        in each column forms one number."
-        
-        So for this input:
-        ```
-        1 2
-        3 4
-        + *
-        ```
-        
-        Position 0: '1', '3', '+' → number "13" with operator +
-        Position 1: ' ', ' ', ' ' → space
-        Position 2: '2', '4', '*' → number "24" with operator *
-        
-        Reading right-to-left, we process:
-        - Position 2 first: 24 with *
-        - Position 0 next: 13 with +
-        
-        So we have two problems processed right-to-left:
-        - Problem 1 (rightmost): 24 (single number with *, identity)
-        - Problem 2: 13 (single number with +, identity)
-        
-        Expected total: 24 + 13 = 37
-        
-        BUT we need to understand how multiple numbers in one problem work!
-        """
-        input_text = """1 2
-3 4
-+ *"""
-        result = solve_part2(input_text)
-        # This test documents expected behavior - actual value TBD
-        self.assertIsInstance(result, int, "Part 2 should return an integer")
+    These inputs are smoke tests that only check solve_part2 returns an
+    integer, so each one runs as a subtest of a single method.
+    """
     
-    def test_simple_single_column_vertical(self):
-        """Test simplest case - single character column.
-        
-        Input:
-        ```
-        5
-        3
-        +
-        ```
-        
-        Position 0: '5', '3', '+' → number "53" with operator +
-        
-        Since there's only one number "53" and operator +, result is 53.
-        
-        Expected: 53
-        """
-        input_text = """5
-3
-+"""
-        result = solve_part2(input_text)
-        # The vertical reading should form "53" from '5' and '3'
-        # With operator +, single number returns itself
-        # This is an assumption to be verified
-        self.assertIsInstance(result, int, "Part 2 should return an integer")
+    CASES = []
     
-    def test_two_rows_vertical_read(self):
-        """Test reading two rows vertically.
-        
-        Input:
-        ```
-        12
-        34
-        +
-        ```
-        
-        Position 0: '1', '3', '+' → number "13"
-        Position 1: '2', '4', ' ' → number "24" (but no operator here)
-        
-        Operator is at position 0, so that defines one problem.
-        But how do we know which positions belong to the problem?
-        
-        This is where the confusion lies - need to understand grouping.
-        """
-        input_text = """12
-34
-+"""
-        result = solve_part2(input_text)
-        self.assertIsInstance(result, int, "Part 2 should return an integer")
-    
-    def test_vertical_with_spaces(self):
-        """Test vertical reading with spaces in the mix.
-        
-        Input:
-        ```
-        1  2
-        3  4
-        +  *
-        ```
-        
-        Position 0: '1', '3', '+' → "13" with +
-        Position 1: ' ', ' ', ' ' → space
-        Position 2: ' ', ' ', ' ' → space  
-        Position 3: '2', '4', '*' → "24" with *
-        
-        Two problems:
-        - Problem at pos 0: 13 with + → result 13
-        - Problem at pos 3: 24 with * → result 24
-        
-        Expected: 13 + 24 = 37
-        """
-        input_text = """1  2
-3  4
-+  *"""
-        result = solve_part2(input_text)
-        self.assertIsInstance(result, int, "Part 2 should return an integer")
+    def test_part2_smoke(self):
+        """Test Part 2 returns an integer for each input in CASES."""
+        for i, input_text in enumerate(self.CASES):
+            with self.subTest(i=i):
+                self.assertIsInstance(solve_part2(input_text), int,
+                                      "Part 2 should return an integer")
 
 
-class TestDay06Part2MultipleNumbersPerProblem(unittest.TestCase):
-    """Tests for understanding how multiple numbers in one problem are grouped in Part 2."""
+class TestDay06Part2VerticalReading(Part2SmokeCases, unittest.TestCase):
+    """Tests for Part 2 vertical reading logic - reading each position top-to-bottom.
     
-    def test_understanding_problem_grouping(self):
-        """Understand how numbers are grouped into problems.
-        
-        From the main example, the task says:
-        "The rightmost problem: 4 + 431 + 623 = 1058"
-        
-        This suggests that one problem can have MULTIPLE numbers.
-        So the question is: how are multiple numbers assigned to one problem?
-        
-        Hypothesis: positions between operators form one problem.
-        Reading each position vertically gives numbers for that problem.
-        """
-        # This is a documentation test
-        self.assertTrue(True, "Understanding test")
+    Each character position is a column, and reading TOP to BOTTOM in each
+    column forms one number.
+    """
     
-    def test_three_positions_one_operator(self):
-        """Test three positions with one operator.
-        
-        Input:
-        ```
-        123
-        456
-        +
-        ```
-        
-        Position 0: '1', '4', '+' → operator position, number "14"
-        Position 1: '2', '5', ' ' → number "25"
-        Position 2: '3', '6', ' ' → number "36"
-        
-        If all three positions belong to one problem with operator +:
-        14 + 25 + 36 = 75
-        
-        Expected: 75
-        """
-        input_text = """123
-456
-+"""
-        result = solve_part2(input_text)
-        # This is speculative - actual grouping logic needs verification
-        self.assertIsInstance(result, int, "Part 2 should return an integer")
+    CASES = [
+        # Position 0: "13" with +, position 2: "24" with *
+        "1 2\n3 4\n+ *",
+        # Single character column: '5', '3', '+' → "53" with +
+        "5\n3\n+",
+        # Two positions, operator only under position 0
+        "12\n34\n+",
+        # Problems separated by two all-space positions
+        "1  2\n3  4\n+  *",
+    ]
 
 
-class TestDay06Part2EdgeCases(unittest.TestCase):
-    """Tests for Part 2 edge cases."""
+class TestDay06Part2MultipleNumbersPerProblem(Part2SmokeCases, unittest.TestCase):
+    """Tests for understanding how multiple numbers in one problem are grouped in Part 2.
     
-    def test_single_position_single_digit(self):
-        """Edge case: Single position, single digit.
-        
-        Input:
-        ```
-        5
-        +
-        ```
-        
-        Position 0: '5', '+' → number "5" with operator +
-        
-        Expected: 5
-        """
-        input_text = """5
-+"""
-        result = solve_part2(input_text)
-        self.assertIsInstance(result, int, "Part 2 should return an integer")
+    From the main example: "The rightmost problem: 4 + 431 + 623 = 1058",
+    so positions between operators form one problem and each position read
+    vertically gives one number for that problem.
+    """
     
-    def test_trailing_spaces_handling(self):
-        """Test handling of trailing spaces.
-        
-        Input has trailing spaces which might affect column counting.
-        """
-        input_text = """12  
-34  
-+   """
-        result = solve_part2(input_text)
-        self.assertIsInstance(result, int, "Part 2 should return an integer")
+    CASES = [
+        # Positions 0-2 read "14", "25", "36"; one + operator → 14 + 25 + 36
+        "123\n456\n+",
+    ]
+
+
+class TestDay06Part2EdgeCases(Part2SmokeCases, unittest.TestCase):
+    """Tests for Part 2 edge cases."""
     
-    def test_skip_space_rows(self):
-        """Test that spaces in vertical reading are handled.
-        
-        Input:
-        ```
-        1
-         
-        3
-        +
-        ```
-        
-        Position 0: '1', ' ', '3', '+' → digits "13", operator +
-        
-        Spaces should be skipped when forming numbers.
-        """
-        input_text = """1
- 
-3
-+"""
-        result = solve_part2(input_text)
-        self.assertIsInstance(result, int, "Part 2 should return an integer")
+    CASES = [
+        # Single position, single digit: "5" with +
+        "5\n+",
+        # Trailing spaces might affect column counting
+        "12  \n34  \n+   ",
+        # Spaces are skipped when forming numbers: '1', ' ', '3' → "13"
+        "1\n \n3\n+",
+    ]
 
 
 class TestDay06Part2RightToLeftProcessing(unittest.TestCase):
@@ -9,18 +9,48 @@ Count the total number of splits.
 
 import sys
 from pathlib import Path
+from typing import FrozenSet, NamedTuple, Tuple
 
 
-def parse_input(input_text: str):
+def find_all(line: str, char: str):
     """
-    Parse the input text into a usable format.
+    Yield every index of char in line.
+    
+    Uses str.find to jump between matches, so the scan runs in C rather
+    than visiting each character from Python.
+    """
+    idx = line.find(char)
+    while idx != -1:
+        yield idx
+        idx = line.find(char, idx + 1)
+
+
+class ParsedGrid(NamedTuple):
+    """
+    Immutable parsed manifold, computed once and shared by both solvers.
     
-    Returns a dictionary containing:
     - rows: number of rows in the grid
     - cols: number of columns in the grid
-    - start_cols: set of starting column positions (where S is located)
-    - splitters: set of (row, col) tuples for splitter positions
-    - grid: list of strings representing the grid
+    - start_cols: starting column positions (where S is located)
+    - splitter_cols: one tuple per splitter row of the splitter columns in that row
+    - splitter_bits: one int per splitter row with bit c set for a splitter at column c
+    
+    Splitters are indexed by row only, so neither solver builds or hashes
+    (row, col) tuples. Rows without a splitter cannot change any beam, so
+    only rows containing one are stored, in top-to-bottom order.
+    """
+    rows: int
+    cols: int
+    start_cols: FrozenSet[int]
+    splitter_cols: Tuple[Tuple[int, ...], ...]
+    splitter_bits: Tuple[int, ...]
+
+
+def parse_input(input_text: str) -> ParsedGrid:
+    """
+    Parse the input text into a ParsedGrid.
+    
+    The grid text is scanned once here; the solvers never touch strings.
     """
     lines = input_text.strip().split('\n')
     
@@ -28,136 +58,107 @@ def parse_input(input_text: str):
     cols = len(lines[0]) if rows > 0 else 0
     
     start_cols = set()
-    splitters = set()
-    
-    for row_idx, line in enumerate(lines):
-        for col_idx, char in enumerate(line):
-            if char == 'S':
-                start_cols.add(col_idx)
-            elif char == '^':
-                splitters.add((row_idx, col_idx))
-    
-    return {
-        'rows': rows,
-        'cols': cols,
-        'start_cols': start_cols,
-        'splitters': splitters,
-        'grid': lines
-    }
-
-
-def solve_part1(data) -> int:
+    splitter_cols = []
+    splitter_bits = []
+    
+    for line in lines:
+        start_cols.update(find_all(line, 'S'))
+        if '^' not in line:
+            continue
+        row_cols = tuple(find_all(line, '^'))
+        row_bits = 0
+        for col_idx in row_cols:
+            row_bits |= 1 << col_idx
+        splitter_cols.append(row_cols)
+        splitter_bits.append(row_bits)
+    
+    return ParsedGrid(
+        rows=rows,
+        cols=cols,
+        start_cols=frozenset(start_cols),
+        splitter_cols=tuple(splitter_cols),
+        splitter_bits=tuple(splitter_bits),
+    )
+
+
+def solve_both(data: ParsedGrid) -> Tuple[int, int]:
     """
-    Solve part 1 of the puzzle.
+    Solve both parts of the puzzle in a single sweep over the rows.
     
-    Simulates the tachyon beam traveling through the manifold and counts
-    the total number of times the beam splits when it encounters splitters.
+    Returns (split count, timeline count).
     
     Algorithm:
-    - Start with beams at all start column(s)
-    - Process row by row
-    - For each active beam that hits a splitter:
-      - Increment split counter
-      - Create two new beams at (col-1) and (col+1)
-    - Beams at the same position automatically merge (using sets)
-    - Beams outside grid bounds are filtered out
+    - Part 1: represent the active beams as a bitset, bit c set if a beam is
+      in column c. Beams that hit a splitter are the bits shared with the
+      row's splitter bits; each one is a split and moves one column left and
+      one column right. Beams at the same position merge (bitwise OR) and
+      beams outside the grid are masked off.
+    - Part 2: timelines never merge, so track how many timelines are in each
+      column. timelines[col + 1] is the count for column col, with one padding
+      column on each side for timelines that left the grid (they still count).
+      A hit splitter moves its whole count to the columns on either side.
+    - A column holds timelines exactly when it holds a Part 1 beam, so both
+      parts only do work in rows where the beam bitset hits a splitter.
     """
-    rows = data['rows']
-    cols = data['cols']
-    start_cols = data['start_cols']
-    splitters = data['splitters']
-    
-    # Track active beam columns as a set (automatically handles merging)
-    active_beams = start_cols.copy()
+    cols = data.cols
+    start_cols = data.start_cols
+    splitter_bits = data.splitter_bits
+    splitter_cols = data.splitter_cols
+    
+    in_bounds = (1 << cols) - 1
+    active_beams = 0
+    timelines = [0] * (cols + 2)
+    for col in start_cols:
+        active_beams |= 1 << col
+        timelines[col + 1] = 1
     split_count = 0
     
-    # Process each row
-    for row in range(rows):
-        # Check which beams hit splitters in this row
-        next_beams = set()
+    for row_bits, row_cols in zip(splitter_bits, splitter_cols):
+        hits = active_beams & row_bits
+        if not hits:
+            continue
+        
+        split_count += hits.bit_count()
+        # Shifting right drops beams leaving column 0; the mask drops the right edge
+        active_beams = ((active_beams ^ hits) | (hits << 1) | (hits >> 1)) & in_bounds
         
-        for col in active_beams:
-            if (row, col) in splitters:
-                # Beam hits a splitter - increment counter and create two new beams
-                split_count += 1
-                
-                # Add left and right beams (will be filtered for bounds)
-                left_col = col - 1
-                right_col = col + 1
-                
-                if 0 <= left_col < cols:
-                    next_beams.add(left_col)
-                if 0 <= right_col < cols:
-                    next_beams.add(right_col)
-            else:
-                # Beam continues straight down to next row
-                next_beams.add(col)
+        # Read every hit count before writing, since adjacent splitters in
+        # one row would otherwise see each other's updates
+        arriving = [(col, timelines[col + 1]) for col in row_cols if timelines[col + 1]]
+        for col, count in arriving:
+            timelines[col + 1] = 0
+        for col, count in arriving:
+            timelines[col] += count
+            timelines[col + 2] += count
         
-        # Update active beams for next row
-        active_beams = next_beams
+        # Every beam has left the grid; the remaining rows cannot change either answer
+        if not active_beams:
+            break
     
-    return split_count
+    return split_count, sum(timelines)
 
 
-def solve_part2(data) -> int:
+def solve_part1(data: ParsedGrid) -> int:
+    """
+    Solve part 1 of the puzzle.
+    
+    Simulates the tachyon beam traveling through the manifold and counts
+    the total number of times the beam splits when it encounters splitters.
+    Beams at the same position merge. See solve_both for the algorithm.
+    """
+    return solve_both(data)[0]
+
+
+def solve_part2(data: ParsedGrid) -> int:
     """
     Solve part 2 of the puzzle.
     
     Count unique quantum timelines through the splitter network.
     Unlike Part 1, timelines NEVER merge even if they reach the same position.
     Each unique path through the network counts as a separate timeline.
-    
-    Algorithm:
-    - Use recursive path counting with memoization
-    - From each position, count all possible paths to the exit
-    - Timelines split when hitting a splitter (left and right paths)
-    - Timelines continue straight when in empty space
-    - Out-of-bounds timelines still count
+    See solve_both for the algorithm.
     """
-    rows = data['rows']
-    cols = data['cols']
-    start_cols = data['start_cols']
-    splitters = data['splitters']
-    
-    # Memoization cache for counting timelines from each position
-    memo = {}
-    
-    def count_timelines(row, col):
-        """
-        Count the number of unique timelines starting from position (row, col).
-        
-        Returns the number of distinct paths from this position to exiting the grid.
-        """
-        # Base case: exited the grid bottom
-        if row >= rows:
-            return 1  # One complete timeline
-        
-        # Check memoization cache
-        if (row, col) in memo:
-            return memo[(row, col)]
-        
-        # Recursive case
-        if (row, col) in splitters:
-            # Hit a splitter: timeline splits into left and right paths
-            left_count = count_timelines(row + 1, col - 1)
-            right_count = count_timelines(row + 1, col + 1)
-            result = left_count + right_count
-        else:
-            # Empty space: continue straight down
-            result = count_timelines(row + 1, col)
-        
-        # Store in cache
-        memo[(row, col)] = result
-        return result
-    
-    # Sum timelines from all starting positions
-    total_timelines = 0
-    for start_col in start_cols:
-        # Start at row 0 (or row 1 if we need to skip the start row)
-        # Based on Part 1, it seems we start processing from row 0
-        total_timelines += count_timelines(0, start_col)
-    
-    return total_timelines
+    return solve_both(data)[1]
 
 
 def main():
@@ -165,10 +166,9 @@ def main():
     input_file = Path(__file__).parent / 'input.txt'
     data = parse_input(input_file.read_text())
 
-    print(f"Part 1: {solve_part1(data)}")
-
-    if (part2 := solve_part2(data)) is not None:
-        print(f"Part 2: {part2}")
+    part1, part2 = solve_both(data)
+    print(f"Part 1: {part1}")
+    print(f"Part 2: {part2}")
 
 
 def test():
@@ -3,6 +3,7 @@
 Download Advent of Code 2025 Day 8 input using session cookie.
 """
 
+import shutil
 import urllib.request
 from pathlib import Path
 
@@ -16,16 +17,24 @@ req = urllib.request.Request(url)
 req.add_header('Cookie', f'session={session_cookie}')
 req.add_header('User-Agent', 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36')
 
+output_file = Path(__file__).parent / 'input.txt'
+partial_file = output_file.with_name(output_file.name + '.part')
+
 try:
-    with urllib.request.urlopen(req) as response:
-        input_data = response.read().decode('utf-8')
+    # Stream the response body to a sibling temp file without decoding it,
+    # and only replace input.txt once the whole body has been read
+    try:
+        with urllib.request.urlopen(req) as response, partial_file.open('wb') as f:
+            shutil.copyfileobj(response, f, length=1 << 16)
+        partial_file.replace(output_file)
+    finally:
+        partial_file.unlink(missing_ok=True)
     
-    # Save to input.txt
-    output_file = Path(__file__).parent / 'input.txt'
-    output_file.write_text(input_data)
+    input_data = output_file.read_bytes()
+    line_count = input_data.count(b'\n') + (0 if input_data.endswith(b'\n') else 1)
     print(f"✅ Downloaded input to {output_file}")
-    print(f"   Input size: {len(input_data)} bytes")
-    print(f"   Number of lines: {len(input_data.strip().split(chr(10)))}")
+    print(f"   Input size: {output_file.stat().st_size} bytes")
+    print(f"   Number of lines: {line_count}")
     
 except urllib.error.HTTPError as e:
     print(f"❌ HTTP Error {e.code}: {e.reason}")
@@ -7,8 +7,15 @@ Junction box circuit connection problem using Union-Find and greedy algorithm.
 
 import sys
 import math
+import heapq
+from array import array
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
 
+# Closest pairs per box selected before part 2 falls back to a wider search
+_CANDIDATES_PER_BOX = 8
+
 
 def parse_input(input_text: str):
     """
@@ -16,16 +23,18 @@ def parse_input(input_text: str):
 
     Input format: Each line contains X,Y,Z coordinates separated by commas.
     Returns: List of tuples (x, y, z)
+    Raises: ValueError if a non-blank line does not have exactly three fields
     """
-    lines = input_text.strip().split('\n')
-    positions = []
+    lines = [line for line in input_text.split('\n') if line.strip()]
     for line in lines:
-        line = line.strip()
-        if line:  # Skip empty lines
-            parts = line.split(',')
-            x, y, z = int(parts[0]), int(parts[1]), int(parts[2])
-            positions.append((x, y, z))
-    return positions
+        if line.count(',') != 2:
+            raise ValueError(f"Expected X,Y,Z but got {line.strip()!r}")
+    if not lines:
+        return []
+    # Join the checked lines so one split() tokenizes every number (int()
+    # ignores surrounding spaces), then regroup in threes
+    values = list(map(int, ','.join(lines).split(',')))
+    return list(zip(values[0::3], values[1::3], values[2::3]))
 
 
 def euclidean_distance(pos1, pos2):
@@ -41,12 +50,128 @@ def euclidean_distance(pos1, pos2):
     """
     x1, y1, z1 = pos1
     x2, y2, z2 = pos2
-    return math.sqrt((x2 - x1)**2 + (y2 - y1)**2 + (z2 - z1)**2)
+    # hypot does the squaring, summing and sqrt in one C call, without
+    # overflow or precision loss on large coordinates
+    return math.hypot(x2 - x1, y2 - y1, z2 - z1)
+
+
+@lru_cache(maxsize=1)
+def pair_distances(points):
+    """
+    Calculate the squared distance between every pair of positions.
+    
+    sqrt is monotonic, so squared distances order pairs exactly like
+    distances do, and with integer coordinates they stay exact integers.
+    
+    Cached on the points, so repeated solves of the same input (part 1 with
+    different num_pairs, part 2, the pair walk's fallback sort) compute the
+    n(n-1)/2 distances only once. Only the latest input is kept, since the
+    result is O(n²) in size. The result is shared between callers and must
+    be treated as read-only.
+    
+    Args:
+        points: Tuple of (x, y, z) coordinate tuples (hashable)
+    
+    Returns:
+        Tuple (first, second, dists): parallel index tuples with
+        first[k] < second[k] in generation order (i, then j), and a flat
+        int32/int64 array (or list, for huge coordinates) of their squared
+        distances
+    """
+    n = len(points)
+    pair_i = []
+    pair_j = []
+    
+    # Largest possible squared distance is 3 * span²; use 4-byte ints when
+    # that fits (halves the array the sort keys on), else 8-byte ints, and
+    # a plain list of Python ints for coordinates too large for either
+    span = max(map(max, points)) - min(map(min, points)) if points else 0
+    max_dist = 3 * span * span
+    if max_dist < 2**31:
+        dists = array('i')
+    elif max_dist < 2**63:
+        dists = array('q')
+    else:
+        dists = []
+    for i in range(n):
+        # Unpack box i once per row, not once per pair
+        xi, yi, zi = points[i]
+        for j in range(i + 1, n):
+            xj, yj, zj = points[j]
+            dx, dy, dz = xi - xj, yi - yj, zi - zj
+            pair_i.append(i)
+            pair_j.append(j)
+            dists.append(dx * dx + dy * dy + dz * dz)
+    return tuple(pair_i), tuple(pair_j), dists
+
+
+def sorted_distance_pairs(data, limit=None):
+    """
+    List every pair of positions, closest first.
+    
+    The pairs are kept as parallel lists rather than one (distance, i, j)
+    tuple per pair: the integer squared distances go in one flat int array
+    and a stable sort of the pair indices by that array gives the processing
+    order.
+    
+    Args:
+        data: List of (x, y, z) coordinate tuples
+        limit: Only return the closest limit pairs (default: all pairs).
+           A heap selection is used instead of sorting every pair.
+    
+    Returns:
+        Tuple (first, second) of parallel index lists with first[k] < second[k],
+        sorted by distance (ties broken by index)
+    """
+    pair_i, pair_j, dists = pair_distances(tuple(data))
+    
+    # Stable sort keeps generation order (i, then j) among equal distances;
+    # nsmallest is equivalent to sorted(...)[:limit], ties included
+    if limit is not None and 0 <= limit < len(dists):
+        order = heapq.nsmallest(limit, range(len(dists)), key=dists.__getitem__)
+    else:
+        order = sorted(range(len(dists)), key=dists.__getitem__)
+    return [pair_i[k] for k in order], [pair_j[k] for k in order]
+
+
+def iter_closest_pairs(data, initial_limit=None):
+    """
+    Yield every pair of positions closest first, sorting lazily.
+    
+    A greedy walk that stops early (such as building a single circuit, which
+    mostly uses short connections) only needs a small prefix of the sorted
+    pairs. Only the closest initial_limit pairs are selected at first; if
+    the caller keeps going past them, the remaining pairs come from a single
+    full sort of the cached distances.
+    
+    Args:
+        data: List of (x, y, z) coordinate tuples
+        initial_limit: Size of the first prefix (default: a few pairs per box)
+    
+    Yields:
+        (index1, index2) tuples with index1 < index2, in the same order as
+        sorted_distance_pairs(data)
+    """
+    n = len(data)
+    total_pairs = n * (n - 1) // 2
+    limit = initial_limit or _CANDIDATES_PER_BOX * n
+    
+    first, second = sorted_distance_pairs(data, limit=min(limit, total_pairs))
+    yield from zip(first, second)
+    
+    start = len(first)
+    if start < total_pairs:
+        # The prefix was an exact prefix of the full order (the selection is
+        # stable), so sort everything once and carry on after it
+        pair_i, pair_j, dists = pair_distances(tuple(data))
+        order = sorted(range(total_pairs), key=dists.__getitem__)
+        for k in islice(order, start, None):
+            yield pair_i[k], pair_j[k]
 
 
 class UnionFind:
     """
-    Union-Find (Disjoint Set Union) data structure with path compression and union by size.
+    Union-Find (Disjoint Set Union) data structure with path halving and union by rank.
     
     Used to efficiently track which junction boxes are in the same electrical circuit.
     """
@@ -55,18 +180,22 @@ class UnionFind:
         """
         Initialize n separate sets (each element is its own parent).
         
+        parent and size are flat C int arrays rather than lists of boxed ints.
+        
         Args:
             n: Number of elements
         """
-        self.parent = list(range(n))  # parent[i] = parent of element i
-        self.size = [1] * n           # size[i] = size of tree rooted at i
+        self.parent = array('i', range(n))  # parent[i] = parent of element i
+        self.rank = bytearray(n)            # rank[i] = upper bound on height of tree rooted at i
+        self.size = array('i', [1]) * n     # size[i] = size of tree rooted at i (roots only)
+        self.roots = set(range(n))          # current root of every set (len = number of sets)
     
     def find(self, x):
         """
-        Find the root of element x with path compression.
+        Find the root of element x with path halving.
         
-        Path compression: Make all nodes on the path point directly to the root
-        for faster future queries.
+        Path halving: Point every other node on the path at its grandparent
+        while walking up, in a single iterative pass (no recursion limit).
         
         Args:
             x: Element to find root of
@@ -74,17 +203,19 @@ class UnionFind:
         Returns:
             Root of the set containing x
         """
-        if self.parent[x] != x:
-            # Path compression: recursively find root and update parent
-            self.parent[x] = self.find(self.parent[x])
-        return self.parent[x]
+        parent = self.parent
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
     
     def union(self, x, y):
         """
         Union the sets containing x and y.
         
-        Uses union by size: attach smaller tree under root of larger tree
-        to keep trees balanced.
+        Uses union by rank: attach the shorter tree under root of the taller
+        tree to keep trees balanced. Ranks stay below log2(n), so they fit in
+        a byte each, apart from the parent list that find() walks.
         
         Args:
             x: First element
@@ -101,14 +232,16 @@ class UnionFind:
         if root_x == root_y:
             return False
         
-        # Union by size: attach smaller tree under larger tree
-        if self.size[root_x] < self.size[root_y]:
-            self.parent[root_x] = root_y
-            self.size[root_y] += self.size[root_x]
-        else:
-            self.parent[root_y] = root_x
-            self.size[root_x] += self.size[root_y]
+        # Union by rank: make root_x the taller tree, then attach root_y under it
+        rank = self.rank
+        if rank[root_x] < rank[root_y]:
+            root_x, root_y = root_y, root_x
+        self.parent[root_y] = root_x
+        self.size[root_x] += self.size[root_y]
+        if rank[root_x] == rank[root_y]:
+            rank[root_x] += 1
         
+        self.roots.discard(root_y)
         return True
     
     def get_circuit_sizes(self):
@@ -118,13 +251,31 @@ class UnionFind:
         Returns:
             List of circuit sizes (one per circuit)
         """
-        # Count how many elements belong to each root
-        circuit_counts = {}
-        for i in range(len(self.parent)):
-            root = self.find(i)
-            circuit_counts[root] = circuit_counts.get(root, 0) + 1
-        
-        return list(circuit_counts.values())
+        # Every root already holds the size of its tree; no find() needed,
+        # and only the current roots are visited rather than every element
+        size = self.size
+        return [size[root] for root in self.roots]
+
+
+def largest_circuits_product(uf):
+    """
+    Multiply together the sizes of the three largest circuits.
+    
+    Args:
+        uf: UnionFind holding the current circuits
+    
+    Returns:
+        Product of three largest circuit sizes (missing circuits count as 1)
+    """
+    # Find three largest circuits (no need to sort all of them)
+    circuit_sizes = heapq.nlargest(3, uf.get_circuit_sizes())
+    
+    # Handle edge case: fewer than 3 circuits
+    # Pad with 1s if needed (circuits of size 1)
+    while len(circuit_sizes) < 3:
+        circuit_sizes.append(1)
+    
+    return circuit_sizes[0] * circuit_sizes[1] * circuit_sizes[2]
 
 
 def solve_part1(data, num_pairs=1000):
@@ -135,10 +286,11 @@ def solve_part1(data, num_pairs=1000):
     then return the product of the three largest circuit sizes.
     
     Algorithm:
-    1. Calculate all pairwise distances
-    2. Sort pairs by distance (closest first)
+    1. Calculate all pairwise squared distances (same order as distances)
+    2. Select the num_pairs closest pairs, sorted by distance (closest first)
     3. Use Union-Find to connect pairs greedily
-    4. Process the first num_pairs closest pairs (some may be skipped if already connected)
+    4. Process the first num_pairs closest pairs (some may be skipped if already connected),
+       stopping early once all boxes are in a single circuit
     5. Return product of three largest circuit sizes
     
     Args:
@@ -152,39 +304,24 @@ def solve_part1(data, num_pairs=1000):
     """
     n = len(data)
     
-    # Step 1: Calculate all pairwise distances
-    # Format: (distance, index1, index2)
-    distance_pairs = []
-    for i in range(n):
-        for j in range(i + 1, n):
-            dist = euclidean_distance(data[i], data[j])
-            distance_pairs.append((dist, i, j))
-    
-    # Step 2: Sort pairs by distance (closest first)
-    distance_pairs.sort()
+    # Steps 1-2: Calculate all pairwise distances, keeping only the
+    # num_pairs closest (sorted closest first)
+    # Format: parallel lists of index1 and index2
+    first, second = sorted_distance_pairs(data, limit=num_pairs)
     
     # Step 3: Initialize Union-Find
     uf = UnionFind(n)
     
     # Step 4: Process the first num_pairs pairs (closest by distance)
     # Some pairs may already be in the same circuit and will be skipped
-    for dist, i, j in distance_pairs[:num_pairs]:
+    for i, j in zip(first[:num_pairs], second[:num_pairs]):
         # Try to connect i and j (returns True if successful, False if already connected)
-        uf.union(i, j)
+        # Once everything is a single circuit, the remaining pairs are all skipped
+        if uf.union(i, j) and len(uf.roots) == 1:
+            break
     
-    # Step 5: Get circuit sizes
-    circuit_sizes = uf.get_circuit_sizes()
-    
-    # Step 6: Find three largest circuits
-    circuit_sizes.sort(reverse=True)
-    
-    # Handle edge case: fewer than 3 circuits
-    # Pad with 1s if needed (circuits of size 1)
-    while len(circuit_sizes) < 3:
-        circuit_sizes.append(1)
-    
-    # Return product of three largest
-    return circuit_sizes[0] * circuit_sizes[1] * circuit_sizes[2]
+    # Steps 5-6: Product of the three largest circuit sizes
+    return largest_circuits_product(uf)
 
 
 def solve_part2(data) -> int | None:
@@ -195,8 +332,10 @@ def solve_part2(data) -> int | None:
     Return product of X coordinates of the last two boxes connected.
     
     Algorithm:
-    1. Calculate all pairwise 3D Euclidean distances
-    2. Sort pairs by distance (closest first)
+    1. Calculate all pairwise squared 3D Euclidean distances (same order as distances)
+    2. Sort pairs by distance (closest first), starting with only the closest
+       few pairs per box and sorting all of them once if the circuit is not
+       complete yet
     3. Use Union-Find to track which boxes are in the same circuit
     4. Process pairs in distance order:
        - Try to connect each pair using Union-Find
@@ -218,26 +357,15 @@ def solve_part2(data) -> int | None:
     if n < 2:
         return None
     
-    # Step 1: Calculate all pairwise distances
-    # Format: (distance, index1, index2)
-    distance_pairs = []
-    for i in range(n):
-        for j in range(i + 1, n):
-            dist = euclidean_distance(data[i], data[j])
-            distance_pairs.append((dist, i, j))
-    
-    # Step 2: Sort pairs by distance (closest first)
-    distance_pairs.sort()
-    
     # Step 3: Initialize Union-Find
     uf = UnionFind(n)
     
-    # Step 4: Process pairs in distance order until we have a single circuit
+    # Steps 1-2 and 4: Process pairs in distance order until we have a single circuit
     # We need exactly n-1 successful connections to connect n boxes
     connections_made = 0
     last_pair = None
     
-    for dist, i, j in distance_pairs:
+    for i, j in iter_closest_pairs(data):
         # Try to connect i and j
         # union() returns True if successful, False if already connected
         if uf.union(i, j):
@@ -260,14 +388,62 @@ def solve_part2(data) -> int | None:
     return x1 * x2
 
 
+def solve_both(data, num_pairs=1000) -> tuple[int, int | None]:
+    """
+    Solve both parts of the puzzle with a single greedy pass.
+    
+    Part 1 is the state of the circuits after the first num_pairs pairs, and
+    part 2 is the last connection of the same closest-first walk, so one
+    lazily sorted pair walk and one Union-Find serve both.
+    
+    Args:
+        data: List of (x, y, z) coordinate tuples
+        num_pairs: Number of closest pairs to process for part 1 (default 1000)
+    
+    Returns:
+        Tuple (part1, part2) matching solve_part1(data, num_pairs) and solve_part2(data)
+    """
+    n = len(data)
+    uf = UnionFind(n)
+    
+    # Start with enough pairs for part 1 plus a few per box for part 2;
+    # only if the circuit is still incomplete after those does the walk fall
+    # back to a single full sort of the remaining pairs
+    closest_pairs = iter_closest_pairs(
+        data, initial_limit=max(num_pairs, _CANDIDATES_PER_BOX * n))
+    
+    part1 = None
+    last_pair = None
+    for attempts, (i, j) in enumerate(closest_pairs):
+        # Snapshot part 1 once exactly num_pairs pairs have been processed
+        if attempts == num_pairs:
+            part1 = largest_circuits_product(uf)
+        if uf.union(i, j):
+            last_pair = (i, j)
+            if len(uf.roots) == 1:
+                break
+    
+    # Ran out of pairs (or formed a single circuit) before num_pairs:
+    # any remaining pairs would all have been skipped
+    if part1 is None:
+        part1 = largest_circuits_product(uf)
+    
+    if last_pair is None:
+        return part1, None
+    
+    index1, index2 = last_pair
+    return part1, data[index1][0] * data[index2][0]
+
+
 def main():
     """Run the solution."""
     input_file = Path(__file__).parent / 'input.txt'
     data = parse_input(input_file.read_text())
 
-    print(f"Part 1: {solve_part1(data)}")
+    part1, part2 = solve_both(data)
+    print(f"Part 1: {part1}")
 
-    if (part2 := solve_part2(data)) is not None:
+    if part2 is not None:
         print(f"Part 2: {part2}")
 
 
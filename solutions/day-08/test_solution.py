@@ -13,7 +13,8 @@ This test suite validates:
 
 import unittest
 import math
-from solution import parse_input, solve_part1, solve_part2
+from solution import parse_input, solve_part1, solve_part2, solve_both
+from solution import sorted_distance_pairs, iter_closest_pairs
 
 
 class TestDay08Parsing(unittest.TestCase):
@@ -110,6 +111,13 @@ class TestDay08Parsing(unittest.TestCase):
         self.assertEqual(len(data), 3)
         self.assertEqual(data[0], (0, 0, 0))
         self.assertEqual(data[2], (2, 2, 2))
+    
+    def test_parse_rejects_wrong_field_count(self):
+        """Test a line without exactly three fields raises instead of shifting later boxes."""
+        with self.assertRaises(ValueError):
+            parse_input("1,2\n3,4,5\n6,7,8")
+        with self.assertRaises(ValueError):
+            parse_input("1,2,3,4\n5,6,7")
 
 
 class TestDay08DistanceCalculation(unittest.TestCase):
@@ -294,6 +302,28 @@ class TestDay08UnionFind(unittest.TestCase):
         self.assertEqual(uf.find(0), uf.find(2),
                         "Elements 0 and 2 should be connected transitively")
     
+    def test_union_find_component_count(self):
+        """Test component count decreases only on successful unions."""
+        try:
+            from solution import UnionFind
+        except ImportError:
+            self.skipTest("UnionFind not yet implemented")
+        
+        uf = UnionFind(4)
+        self.assertEqual(len(uf.roots), 4)
+        
+        uf.union(0, 1)
+        uf.union(2, 3)
+        self.assertEqual(len(uf.roots), 2)
+        
+        # Already connected: count unchanged
+        uf.union(1, 0)
+        self.assertEqual(len(uf.roots), 2)
+        
+        uf.union(1, 3)
+        self.assertEqual(len(uf.roots), 1,
+                        "All elements should form a single component")
+    
     def test_union_find_get_circuit_sizes(self):
         """Test getting circuit sizes."""
         try:
@@ -490,6 +520,16 @@ class TestDay08Part1(unittest.TestCase):
         
         self.assertEqual(result, 1, 
                         "Zero connections should give product of 1×1×1=1")
+    
+    def test_part1_huge_coordinates(self):
+        """Test Part 1 when squared distances overflow a 64-bit int."""
+        data = [(0, 0, 0), (10**10, 0, 0), (0, 10**10, 1)]
+        
+        # Closest pair is (0,0,0)-(10^10,0,0): circuits [2, 1] → 2 × 1 × 1 = 2
+        result = solve_part1(data, 1)
+        
+        self.assertEqual(result, 2,
+                        "Huge coordinates should still be ranked exactly")
 
 
 class TestDay08Part2(unittest.TestCase):
@@ -839,6 +879,40 @@ class TestDay08Integration(unittest.TestCase):
         self.assertIsInstance(result, int)
         self.assertGreater(result, 0)
 
+    
+    def test_solve_both_matches_separate_parts(self):
+        """Test the fused single pass agrees with solve_part1 and solve_part2."""
+        simple_input = """0,0,0
+1,0,0
+10,0,0
+11,0,0
+30,0,0
+31,1,0"""
+        data = parse_input(simple_input)
+        
+        for num_pairs in (0, 1, 2, 4, 15, 1000):
+            with self.subTest(num_pairs=num_pairs):
+                self.assertEqual(solve_both(data, num_pairs),
+                                 (solve_part1(data, num_pairs), solve_part2(data)))
+        
+        # Single box: no connection possible for part 2
+        self.assertEqual(solve_both(parse_input("5,5,5")), (1, None))
+    
+    def test_iter_closest_pairs_falls_back_to_full_sort(self):
+        """Test the prefix-then-full-sort pair walk matches the full sorted order."""
+        data = parse_input("""0,0,0
+1,0,0
+10,0,0
+11,0,0
+30,0,0
+31,1,0""")
+        first, second = sorted_distance_pairs(data)
+        
+        # After a 1-pair heap-selected prefix, the walk falls back to one
+        # full sort for the remaining 14 pairs
+        self.assertEqual(list(iter_closest_pairs(data, initial_limit=1)),
+                         list(zip(first, second)))
+
 
 if __name__ == '__main__':
     unittest.main()
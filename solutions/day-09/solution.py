@@ -11,8 +11,10 @@ Algorithm:
 4. Return maximum area found
 """
 
-from itertools import combinations
-from functools import lru_cache
+import math
+import os
+from bisect import bisect_left, bisect_right
+from itertools import islice, repeat
 
 
 def parse_input(text: str):
@@ -23,19 +25,85 @@ def parse_input(text: str):
         
     Returns:
         List of (x, y) tuples representing tile coordinates
+        
+    Raises:
+        ValueError: If a non-blank line does not have exactly two fields
+    """
+    lines = [line for line in text.split('\n') if line.strip()]
+    for line in lines:
+        if line.count(',') != 1:
+            raise ValueError(f"Expected x,y but got {line.strip()!r}")
+    if not lines:
+        return []
+    # Join the checked lines so one split() tokenizes every number (int()
+    # ignores surrounding spaces), then regroup in pairs
+    values = list(map(int, ','.join(lines).split(',')))
+    return list(zip(values[0::2], values[1::2]))
+
+
+def staircase(tiles, x_sign, y_sign):
+    """Find the tiles not dominated towards one corner of the plane.
+    
+    With x_sign = y_sign = 1 this is the lower-left staircase: tiles for
+    which no other tile has both x and y less than or equal. Signs of -1
+    flip the direction (e.g. (-1, -1) gives the upper-right staircase).
+    
+    Args:
+        tiles: List of (x, y) tuples
+        x_sign: 1 to prefer small x, -1 to prefer large x
+        y_sign: 1 to prefer small y, -1 to prefer large y
+        
+    Returns:
+        List of (x, y) tuples on the staircase (duplicates removed)
+    """
+    front = []
+    best_y = None
+    # Sweep in x order; within one x the best y comes first, so a tile
+    # survives only if it strictly beats every tile swept before it on y
+    for x, y in sorted(tiles, key=lambda t: (x_sign * t[0], y_sign * t[1])):
+        if best_y is None or y_sign * y < best_y:
+            front.append((x, y))
+            best_y = y_sign * y
+    return front
+
+
+def max_area_between(tiles_a, tiles_b):
+    """Find the maximum rectangle area with one corner from each tile list.
+    
+    Args:
+        tiles_a: List of (x, y) tuples for the first corner
+        tiles_b: List of (x, y) tuples for the opposite corner
+        
+    Returns:
+        Maximum area over diagonal pairs, or 0 if there are none
     """
-    tiles = []
-    for line in text.strip().split('\n'):
-        line = line.strip()
-        if line:  # Skip empty lines
-            x, y = line.split(',')
-            tiles.append((int(x), int(y)))
-    return tiles
+    max_area = 0
+    
+    # One starting tile at a time: the inner max() runs over the other
+    # list in a single C-level reduction
+    for x1, y1 in tiles_a:
+        row_max = max(
+            # Calculate area using inclusive counting
+            ((abs(x2 - x1) + 1) * (abs(y2 - y1) + 1)
+             for x2, y2 in tiles_b
+             # Tiles must be diagonally opposite (different x AND different y)
+             if x1 != x2 and y1 != y2),
+            default=0,
+        )
+        if row_max > max_area:
+            max_area = row_max
+    
+    return max_area
 
 
 def solve_part1(text: str) -> int:
     """Solve Part 1: Find maximum rectangle area.
     
+    A corner tile can always be swapped for a tile further out in the same
+    direction without shrinking the rectangle, so the best rectangle joins a
+    lower-left staircase tile to an upper-right one, or an upper-left one to
+    a lower-right one. Only those staircase pairs are checked.
+    
     Args:
         text: Input string with coordinate pairs
         
@@ -48,85 +116,72 @@ def solve_part1(text: str) -> int:
     if len(tiles) < 2:
         return 0
     
-    max_area = 0
-    
-    # Check all pairs of tiles
-    for (x1, y1), (x2, y2) in combinations(tiles, 2):
-        # Tiles must be diagonally opposite (different x AND different y)
-        if x1 != x2 and y1 != y2:
-            # Calculate area using inclusive counting
-            width = abs(x2 - x1) + 1
-            height = abs(y2 - y1) + 1
-            area = width * height
-            max_area = max(max_area, area)
-    
-    return max_area
+    return max(
+        max_area_between(staircase(tiles, 1, 1), staircase(tiles, -1, -1)),
+        max_area_between(staircase(tiles, 1, -1), staircase(tiles, -1, 1)),
+    )
 
 
-def get_line_tiles(start, end):
-    """Get all tiles on the straight line between start and end.
+def iter_line_tiles(start, end):
+    """Iterate over all tiles on the straight line between start and end.
     
-    Assumes start and end share same x OR same y coordinate.
+    Assumes start and end share same x OR same y coordinate. The tiles come
+    from zip() over a range and a repeated coordinate, so callers can feed
+    them straight into a set without building a set per line.
     
     Args:
         start: (x, y) tuple for starting position
         end: (x, y) tuple for ending position
         
     Returns:
-        Set of (x, y) tuples representing all tiles on the line
+        Iterator of (x, y) tuples representing all tiles on the line
     """
     x1, y1 = start
     x2, y2 = end
-    tiles = set()
     
     if x1 == x2:  # Vertical line
         y_min, y_max = min(y1, y2), max(y1, y2)
-        for y in range(y_min, y_max + 1):
-            tiles.add((x1, y))
+        return zip(repeat(x1), range(y_min, y_max + 1))
     else:  # Horizontal line (y1 == y2)
         x_min, x_max = min(x1, x2), max(x1, x2)
-        for x in range(x_min, x_max + 1):
-            tiles.add((x, y1))
-    
-    return tiles
+        return zip(range(x_min, x_max + 1), repeat(y1))
 
 
-def point_in_polygon(point, polygon):
-    """Determine if a point is inside a polygon using ray casting algorithm.
+def get_line_tiles(start, end):
+    """Get all tiles on the straight line between start and end.
     
-    Casts a ray from the point to infinity and counts edge crossings.
-    Odd number of crossings = inside, even = outside.
+    Assumes start and end share same x OR same y coordinate.
     
     Args:
-        point: (x, y) tuple for the point to test
-        polygon: List of (x, y) tuples representing polygon vertices in order
+        start: (x, y) tuple for starting position
+        end: (x, y) tuple for ending position
         
     Returns:
-        True if point is inside polygon, False otherwise
+        Set of (x, y) tuples representing all tiles on the line
     """
-    # Convert polygon to tuple for caching
-    polygon_tuple = tuple(polygon) if not isinstance(polygon, tuple) else polygon
-    return _point_in_polygon_cached(point, polygon_tuple)
+    return set(iter_line_tiles(start, end))
 
 
-@lru_cache(maxsize=100000)
-def _point_in_polygon_cached(point, polygon_tuple):
-    """Cached version of point_in_polygon for performance.
+def point_in_polygon(point, polygon):
+    """Determine if a point is inside a polygon using ray casting algorithm.
+    
+    Casts a ray from the point to infinity and counts edge crossings.
+    Odd number of crossings = inside, even = outside.
     
     Args:
         point: (x, y) tuple for the point to test
-        polygon_tuple: Tuple of (x, y) tuples representing polygon vertices
+        polygon: List of (x, y) tuples representing polygon vertices in order
         
     Returns:
         True if point is inside polygon, False otherwise
     """
     x, y = point
-    n = len(polygon_tuple)
+    n = len(polygon)
     inside = False
     
-    p1x, p1y = polygon_tuple[0]
+    p1x, p1y = polygon[0]
     for i in range(1, n + 1):
-        p2x, p2y = polygon_tuple[i % n]
+        p2x, p2y = polygon[i % n]
         
         # Check if horizontal ray from point intersects edge
         if y > min(p1y, p2y):
@@ -172,11 +227,7 @@ def get_green_tiles(red_tiles):
         next_tile = red_tiles[(i + 1) % n]  # Wrap around
         
         # Add all tiles on the straight line between curr and next_tile
-        path_tiles = get_line_tiles(curr, next_tile)
-        green_tiles.update(path_tiles)
-    
-    # Remove red tiles from green tiles (red tiles are not green)
-    green_tiles -= red_set
+        green_tiles.update(iter_line_tiles(curr, next_tile))
     
     # Only compute interior tiles if bounding box is reasonable (< 100k tiles)
     if len(red_tiles) >= 3:
@@ -188,36 +239,35 @@ def get_green_tiles(red_tiles):
         bbox_area = (max_x - min_x + 1) * (max_y - min_y + 1)
         
         if bbox_area < 100000:  # Only for reasonably-sized grids
-            for x in range(min_x, max_x + 1):
-                for y in range(min_y, max_y + 1):
-                    if (x, y) not in red_set and (x, y) not in green_tiles:
-                        if point_in_polygon((x, y), red_tiles):
-                            green_tiles.add((x, y))
-    
-    return green_tiles
-
-
-def connect_points(a, b):
-    """Draw edges of a rectangle between two points.
+            edges = list(zip(red_tiles, red_tiles[1:] + red_tiles[:1]))
+            
+            # Scanline version of point_in_polygon: a row's ray crossings
+            # depend only on y, so find them once per row instead of once
+            # per point. Each edge the ray at height y passes through
+            # counts for every x up to its crossing point.
+            for y in range(min_y, max_y + 1):
+                crossings = sorted(
+                    p1x if p1x == p2x else (y - p1y) * (p2x - p1x) / (p2y - p1y) + p1x
+                    for (p1x, p1y), (p2x, p2y) in edges
+                    if min(p1y, p2y) < y <= max(p1y, p2y)
+                )
+                
+                # x values with exactly j crossings left of them lie in
+                # (crossings[j-1], crossings[j]]; the run is inside when an
+                # odd number of crossings remain at or right of x. Whole runs
+                # go into the set at once, with no per-point membership test
+                # (path tiles are already there; red tiles are removed below).
+                start = min_x
+                for j, crossing in enumerate(crossings):
+                    stop = min(math.floor(crossing), max_x)
+                    if (len(crossings) - j) % 2 and start <= stop:
+                        green_tiles.update(zip(range(start, stop + 1), repeat(y)))
+                    start = max(start, math.floor(crossing) + 1)
     
-    If the points are in a line (same x or y), it's just a line segment.
-    Otherwise, draws all 4 edges of the rectangle.
+    # Remove red tiles from green tiles (red tiles are not green)
+    green_tiles -= red_set
     
-    Args:
-        a: (x, y) tuple for first point
-        b: (x, y) tuple for second point
-        
-    Returns:
-        Set of (x, y) tuples representing all points on the edges
-    """
-    points = set()
-    x_range = [min(a[0], b[0]), max(a[0], b[0]) + 1]
-    y_range = [min(a[1], b[1]), max(a[1], b[1]) + 1]
-    points.update((x, a[1]) for x in range(*x_range))
-    points.update((x, b[1]) for x in range(*x_range))
-    points.update((a[0], y) for y in range(*y_range))
-    points.update((b[0], y) for y in range(*y_range))
-    return points
+    return green_tiles
 
 
 def intersects(tile_edge, area_edge):
@@ -247,6 +297,72 @@ def intersects(tile_edge, area_edge):
     return False
 
 
+def index_segments(segments):
+    """Group polygon edges by orientation for fast crossing queries.
+    
+    Vertical edges are kept sorted by x and horizontal edges sorted by y, so
+    a rectangle edge only has to look at the polygon edges in its own span
+    (found by binary search) instead of every edge.
+    
+    Args:
+        segments: Iterable of polygon edges, each a tuple of two (x, y) points
+        
+    Returns:
+        Tuple (vertical, horizontal, other): vertical is a sorted list of
+        (x, y_min, y_max), horizontal a sorted list of (y, x_min, x_max), and
+        other a list of the remaining (diagonal) edges
+    """
+    vertical = []
+    horizontal = []
+    other = []
+    for segment in segments:
+        (x1, y1), (x2, y2) = segment
+        if x1 == x2:
+            vertical.append((x1, min(y1, y2), max(y1, y2)))
+        elif y1 == y2:
+            horizontal.append((y1, min(x1, x2), max(x1, x2)))
+        else:
+            other.append(segment)
+    vertical.sort()
+    horizontal.sort()
+    return vertical, horizontal, other
+
+
+def crosses_segments(area_edge, segment_index):
+    """Check whether a rectangle edge crosses any indexed polygon edge.
+    
+    Equivalent to calling intersects(segment, area_edge) for every polygon
+    edge: a horizontal rectangle edge can only cross a vertical polygon edge
+    strictly inside both spans, and vice versa.
+    
+    Args:
+        area_edge: Tuple of two (x, y) points representing rectangle edge
+        segment_index: Result of index_segments for the polygon edges
+        
+    Returns:
+        True if any polygon edge crosses the rectangle edge, False otherwise
+    """
+    vertical, horizontal, other = segment_index
+    (a1x, a1y), (a2x, a2y) = sorted(area_edge)
+    
+    if a1y == a2y and a1x < a2x:
+        # Horizontal rectangle edge: vertical polygon edges with a1x < x < a2x
+        start = bisect_right(vertical, (a1x, math.inf))
+        end = bisect_left(vertical, (a2x, -math.inf))
+        for _, y_min, y_max in islice(vertical, start, end):
+            if y_min < a1y < y_max:
+                return True
+    elif a1x == a2x and a1y < a2y:
+        # Vertical rectangle edge: horizontal polygon edges with a1y < y < a2y
+        start = bisect_right(horizontal, (a1y, math.inf))
+        end = bisect_left(horizontal, (a2y, -math.inf))
+        for _, x_min, x_max in islice(horizontal, start, end):
+            if x_min < a1x < x_max:
+                return True
+    
+    return any(intersects(segment, area_edge) for segment in other)
+
+
 def corners_outside(a, b, outer_tiles):
     """Lightweight spot check to ensure 4 corners are within the bounds.
     
@@ -256,22 +372,23 @@ def corners_outside(a, b, outer_tiles):
     Args:
         a: (x, y) tuple for first corner
         b: (x, y) tuple for second corner (opposite diagonal)
-        outer_tiles: Dict mapping y-coordinate to list of x-coordinates on polygon boundary
+        outer_tiles: Dict mapping y-coordinate to (min_x, max_x) of the polygon
+            boundary in that row
         
     Returns:
         True if corners are outside bounds, False if they're inside
     """
     if a[1] not in outer_tiles or b[1] not in outer_tiles:
         return True
-    a_row_tile_xs = outer_tiles[a[1]]
-    b_row_tile_xs = outer_tiles[b[1]]
+    a_row_min, a_row_max = outer_tiles[a[1]]
+    b_row_min, b_row_max = outer_tiles[b[1]]
+    x_lo, x_hi = min(a[0], b[0]), max(a[0], b[0])
 
-    return len(a_row_tile_xs) == 0 or len(b_row_tile_xs) == 0 \
-        or (min(a[0], b[0]) < min(a_row_tile_xs)) or (max(a[0], b[0]) > max(a_row_tile_xs)) \
-        or (min(a[0], b[0]) < min(b_row_tile_xs)) or (max(a[0], b[0]) > max(b_row_tile_xs))
+    return x_lo < a_row_min or x_hi > a_row_max \
+        or x_lo < b_row_min or x_hi > b_row_max
 
 
-def find_largest_inside(tiles):
+def find_largest_inside(tiles, verbose=False):
     """Find largest rectangle inside the polygon using edge intersection test.
     
     This is the correct approach: instead of checking every tile in a rectangle,
@@ -280,6 +397,7 @@ def find_largest_inside(tiles):
     
     Args:
         tiles: List of (x, y) tuples representing red tiles (polygon vertices)
+        verbose: Print each improved rectangle as it is found (default False)
         
     Returns:
         Maximum area of any rectangle that fits inside the polygon
@@ -296,37 +414,45 @@ def find_largest_inside(tiles):
     if all_same_x or all_same_y:
         return 0  # No interior, can't have valid rectangles
     
-    # Add first tile to end to close the loop
-    tiles_loop = tiles + [tiles[0]]
-    
     outer_tiles = dict()
     outer_segments = set()
 
-    previous = tiles_loop[0]
-    outer_segments.add((tiles_loop[-1], tiles_loop[0]))
-
-    # Build polygon edges and boundary point map
-    for tile in tiles_loop[1:]:
-        points = connect_points(previous, tile)
-        for p in points:
-            if p[1] not in outer_tiles:
-                outer_tiles[p[1]] = [p[0]]
+    # Build polygon edges and boundary point map; tiles[-1] for i = 0
+    # closes the loop without copying the list
+    for i in range(len(tiles)):
+        previous, tile = tiles[i - 1], tiles[i]
+        # Record the edge's rows straight into outer_tiles without building
+        # a set of every boundary point. Each row only keeps its running
+        # (min, max) x, which is all corners_outside needs; every row the
+        # edge touches spans x_min..x_max (the horizontal sides fully, the
+        # vertical sides at their ends).
+        (p_x, p_y), (t_x, t_y) = previous, tile
+        x_min, x_max = min(p_x, t_x), max(p_x, t_x)
+        for y in range(min(p_y, t_y), max(p_y, t_y) + 1):
+            bounds = outer_tiles.get(y)
+            if bounds is None:
+                outer_tiles[y] = (x_min, x_max)
             else:
-                outer_tiles[p[1]].append(p[0])
+                outer_tiles[y] = (min(bounds[0], x_min), max(bounds[1], x_max))
         outer_segments.add((previous, tile))
-        previous = tile
+    
+    segment_index = index_segments(outer_segments)
 
     largest_area = 0
 
     # Check all rectangle candidates
     for idx, (a_x, a_y) in enumerate(tiles):
+        # Only candidates that would beat the best rectangle so far (from any
+        # starting corner) are worth sorting and checking
         potential_areas = [
-            (max(largest_area, (abs(p[0] - a_x) + 1) * (abs(p[1] - a_y) + 1)), p) 
-            for p in tiles[idx+1:]
+            (area, p)
+            for p in islice(tiles, idx + 1, None)
+            if (area := (abs(p[0] - a_x) + 1) * (abs(p[1] - a_y) + 1)) > largest_area
         ]
+        potential_areas.sort(reverse=True)
 
-        for potential_area, (b_x, b_y) in sorted(potential_areas, reverse=True):
-            if potential_area <= largest_area or corners_outside((a_x, a_y), (b_x, b_y), outer_tiles):
+        for potential_area, (b_x, b_y) in potential_areas:
+            if corners_outside((a_x, a_y), (b_x, b_y), outer_tiles):
                 continue
 
             # Check if rectangle edges intersect with polygon edges
@@ -337,18 +463,15 @@ def find_largest_inside(tiles):
                 ((b_x, a_y), (b_x, b_y))
             ]
             
-            inside_fit = True
-            for area_segment in area_segments:
-                for outer_segment in outer_segments:
-                    if intersects(outer_segment, area_segment):
-                        inside_fit = False
-                        break
-                if not inside_fit:
-                    break
+            inside_fit = not any(
+                crosses_segments(area_segment, segment_index)
+                for area_segment in area_segments
+            )
             
             if inside_fit:
-                print(f"Found valid rectangle: {potential_area:,}")
-                print(f"  Corners: ({a_x},{a_y}) to ({b_x},{b_y})")
+                if verbose:
+                    print(f"Found valid rectangle: {potential_area:,}")
+                    print(f"  Corners: ({a_x},{a_y}) to ({b_x},{b_y})")
                 largest_area = potential_area
                 break  # Early termination - found the largest for this starting corner
 
@@ -383,7 +506,7 @@ def is_rectangle_valid(corner1, corner2, valid_tiles):
     return True
 
 
-def solve_part2(text: str) -> int:
+def solve_part2(text: str, verbose: bool = False) -> int:
     """Solve Part 2: Find maximum rectangle with only red/green tiles.
     
     Uses edge intersection testing instead of tile-by-tile validation.
@@ -391,19 +514,22 @@ def solve_part2(text: str) -> int:
     
     Args:
         text: Input string with coordinate pairs
+        verbose: Print progress and each improved rectangle (default False)
         
     Returns:
         Maximum area of any rectangle containing only red/green tiles
     """
-    print("Part 2: Starting...")
+    if verbose:
+        print("Part 2: Starting...")
     tiles = parse_input(text)
-    print(f"Part 2: Parsed {len(tiles)} tiles")
+    if verbose:
+        print(f"Part 2: Parsed {len(tiles)} tiles")
     
     # Handle edge cases
     if len(tiles) < 2:
         return 0
     
-    result = find_largest_inside(tiles)
+    result = find_largest_inside(tiles, verbose=verbose)
     return result
 
 
@@ -412,8 +538,10 @@ def main():
     with open('input.txt', 'r') as f:
         data = f.read()
     
+    verbose = os.environ.get('AOC_VERBOSE', '') not in ('', '0')
+    
     print(f"Part 1: {solve_part1(data)}")
-    print(f"Part 2: {solve_part2(data)}")
+    print(f"Part 2: {solve_part2(data, verbose=verbose)}")
 
 
 if __name__ == '__main__':
@@ -20,7 +20,8 @@ from solution import (
     get_line_tiles,
     point_in_polygon,
     get_green_tiles,
-    is_rectangle_valid
+    is_rectangle_valid,
+    staircase
 )
 
 
@@ -86,6 +87,13 @@ class TestDay09Parsing(unittest.TestCase):
         expected = [(-5, -5), (5, 5)]
         result = parse_input(input_text)
         self.assertEqual(result, expected)
+    
+    def test_parse_rejects_wrong_field_count(self):
+        """Test a line without exactly two fields raises instead of shifting later tiles."""
+        with self.assertRaises(ValueError):
+            parse_input("1,2\n3\n4,5")
+        with self.assertRaises(ValueError):
+            parse_input("1,2,3\n4,5")
 
 
 class TestDay09Part1(unittest.TestCase):
@@ -281,6 +289,19 @@ class TestDay09ComplexCases(unittest.TestCase):
         input_text2 = "11,7\n2,3"
         result2 = solve_part1(input_text2)
         self.assertEqual(result2, 50, "Spec trace: (11,7)-(2,3) should be 50")
+    
+    def test_staircase_lower_left(self):
+        """Test that dominated tiles are dropped from the lower-left staircase."""
+        tiles = [(0, 5), (1, 1), (3, 0), (2, 2), (4, 4), (1, 1)]
+        # (2,2) and (4,4) are dominated by (1,1); the duplicate is dropped
+        self.assertEqual(staircase(tiles, 1, 1), [(0, 5), (1, 1), (3, 0)])
+    
+    def test_max_uses_interior_tile_on_staircase(self):
+        """Test a best corner that is not an x or y extreme of the tiles."""
+        # (1,7) is on the upper-left staircase but is not a min/max x or y tile
+        input_text = "0,6\n1,7\n6,3\n6,9"
+        # (1,7) to (6,3): 6×5 = 30 beats (0,6)-(6,3) = 28 and (0,6)-(6,9) = 28
+        self.assertEqual(solve_part1(input_text), 30)
 
 
 class TestDay09Part2LineGeneration(unittest.TestCase):